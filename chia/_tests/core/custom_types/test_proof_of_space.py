@@ -5,11 +5,17 @@ from dataclasses import dataclass
 from typing import Optional
 
 import pytest
+from bitstring import BitArray
 from chia_rs import G1Element
 
 from chia._tests.util.misc import Marks, datacases
 from chia.consensus.default_constants import DEFAULT_CONSTANTS
-from chia.types.blockchain_format.proof_of_space import ProofOfSpace, passes_plot_filter, verify_and_get_quality_string
+from chia.types.blockchain_format.proof_of_space import (
+    ProofOfSpace,
+    calculate_plot_filter_input,
+    passes_plot_filter,
+    verify_and_get_quality_string,
+)
 from chia.types.blockchain_format.sized_bytes import bytes32, bytes48
 from chia.util.ints import uint8, uint32
 
@@ -142,3 +148,14 @@ class TestProofOfSpace:
                 success_count += 1
 
         assert abs((success_count * target_filter / num_trials) - 1) < 0.35
+
+    @pytest.mark.parametrize("prefix_bits", [DEFAULT_CONSTANTS.NUMBER_ZERO_BITS_PLOT_FILTER, 8, 7, 6, 5, 1])
+    def test_plot_filter_matches_bit_prefix(self, prefix_bits: int, seeded_random: random.Random) -> None:
+        for _ in range(10000):
+            challenge_hash = bytes32.random(seeded_random)
+            plot_id = bytes32.random(seeded_random)
+            sp_output = bytes32.random(seeded_random)
+
+            plot_filter = BitArray(calculate_plot_filter_input(plot_id, challenge_hash, sp_output))
+            expected = plot_filter[:prefix_bits].uint == 0
+            assert passes_plot_filter(prefix_bits, plot_id, challenge_hash, sp_output) == expected
@@ -10,6 +10,7 @@ from os import mkdir
 from pathlib import Path
 from shutil import copy
 from typing import Any, Awaitable, Callable, Dict, List, Union, cast
+from unittest import mock
 
 import pytest
 
@@ -149,6 +150,10 @@ async def test_farmer_reward_target_endpoints(harvester_farmer_environment: Harv
     assert "have_farmer_sk" not in targets_1
     targets_2 = await farmer_rpc_client.get_reward_targets(True, 2)
     assert targets_2["have_pool_sk"] and targets_2["have_farmer_sk"]
+    # the same search again is answered without deriving any puzzle hashes
+    with mock.patch("chia.farmer.farmer.match_address_to_sk") as match_address_to_sk:
+        assert await farmer_rpc_client.get_reward_targets(True, 2) == targets_2
+        match_address_to_sk.assert_not_called()
 
     new_ph: bytes32 = create_puzzlehash_for_pk(master_sk_to_wallet_sk(bt.farmer_master_sk, uint32(2)).get_g1())
     new_ph_2: bytes32 = create_puzzlehash_for_pk(master_sk_to_wallet_sk(bt.pool_master_sk, uint32(7)).get_g1())
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass
 from time import time
 from types import TracebackType
@@ -70,7 +71,7 @@ class IncrementPoolStatsCase:
             prepared_p2_singleton_puzzle_hash: {
                 "p2_singleton_puzzle_hash": prepared_p2_singleton_puzzle_hash.hex(),
                 "xxx_since_start": 1,
-                "xxx_24h": [(1689491043, 1)],
+                "xxx_24h": deque([(1689491043, 1)]),
                 "current_difficulty": 1,
             }
         }
@@ -233,10 +234,20 @@ class NewProofOfSpaceCase:
             StripOldEntriesCase([(1689491043.3493967, 1)], 1689491043, [(1689491043.3493967, 1)]),
             id="not_stripped",
         ),
+        pytest.param(
+            StripOldEntriesCase(
+                [(1689491042, 1), (1689491043, 2), (1689491043, 3), (1689491044, 4)],
+                1689491043,
+                [(1689491043, 2), (1689491043, 3), (1689491044, 4)],
+            ),
+            id="partially_stripped",
+        ),
     ],
 )
 def test_strip_old_entries(case: StripOldEntriesCase) -> None:
-    assert strip_old_entries(case.pairs, case.before) == case.expected_result
+    pairs = deque(case.pairs)
+    strip_old_entries(pairs, case.before)
+    assert list(pairs) == case.expected_result
 
 
 @pytest.mark.parametrize(
@@ -263,7 +274,7 @@ def test_strip_old_entries(case: StripOldEntriesCase) -> None:
                 {
                     "p2_singleton_puzzle_hash": std_hash(b"11223344").hex(),
                     "xxx_since_start": 1,
-                    "xxx_24h": [(1689491043, 1)],
+                    "xxx_24h": deque([(1689491043, 1)]),
                     "current_difficulty": 1,
                 },
             ),
@@ -279,7 +290,7 @@ def test_strip_old_entries(case: StripOldEntriesCase) -> None:
                 {
                     "p2_singleton_puzzle_hash": std_hash(b"11223344").hex(),
                     "xxx_since_start": 2,
-                    "xxx_24h": [(1689491043, 1), (1689491044, 2)],
+                    "xxx_24h": deque([(1689491043, 1), (1689491044, 2)]),
                     "current_difficulty": 1,
                 },
             ),
@@ -295,7 +306,7 @@ def test_strip_old_entries(case: StripOldEntriesCase) -> None:
                 {
                     "p2_singleton_puzzle_hash": std_hash(b"11223344").hex(),
                     "xxx_since_start": 2,
-                    "xxx_24h": [(1689491043, 1), (1689491044, 1)],
+                    "xxx_24h": deque([(1689491043, 1), (1689491044, 1)]),
                     "current_difficulty": 1,
                 },
             ),
@@ -311,7 +322,7 @@ def test_strip_old_entries(case: StripOldEntriesCase) -> None:
                 {
                     "p2_singleton_puzzle_hash": std_hash(b"11223344").hex(),
                     "xxx_since_start": 2,
-                    "xxx_24h": [(1689577444, 1)],
+                    "xxx_24h": deque([(1689577444, 1)]),
                     "current_difficulty": 1,
                 },
             ),
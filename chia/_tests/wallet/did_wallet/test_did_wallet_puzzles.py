@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import random
+from typing import Dict, List
+
+import pytest
+
+from chia.types.blockchain_format.program import Program
+from chia.types.blockchain_format.sized_bytes import bytes32
+from chia.util.ints import uint64
+from chia.wallet.did_wallet.did_wallet_puzzles import (
+    create_innerpuz,
+    did_program_to_metadata,
+    get_inner_puzhash_by_p2,
+    metadata_to_program,
+)
+
+
+@pytest.mark.parametrize("num_backup_ids", [0, 1, 5])
+@pytest.mark.parametrize("metadata", [Program.to([]), Program.to([("Twitter", "Test")])])
+def test_get_inner_puzhash_by_p2(num_backup_ids: int, metadata: Program, seeded_random: random.Random) -> None:
+    launcher_id = bytes32.random(seeded_random)
+    recovery_list: List[bytes32] = [bytes32.random(seeded_random) for _ in range(num_backup_ids)]
+    num_of_backup_ids_needed = uint64(num_backup_ids)
+    # call it twice for different p2 puzzle hashes to also cover the cached curried arguments
+    for _ in range(2):
+        p2_puzhash = bytes32.random(seeded_random)
+        innerpuz = create_innerpuz(p2_puzhash, recovery_list, num_of_backup_ids_needed, launcher_id, metadata)
+        assert get_inner_puzhash_by_p2(
+            p2_puzhash, recovery_list, num_of_backup_ids_needed, launcher_id, metadata
+        ) == innerpuz.get_tree_hash_precalc(p2_puzhash)
+
+
+@pytest.mark.parametrize("metadata", [{}, {"Twitter": "Test"}, {"Twitter": "Test", "GitHub": "测试"}])
+def test_metadata_program_roundtrip(metadata: Dict[str, str]) -> None:
+    program = metadata_to_program(metadata)
+    assert program == Program.to([(key, value) for key, value in metadata.items()])
+    assert did_program_to_metadata(program) == metadata
@@ -91,12 +91,19 @@ from chia.wallet.util.tx_config import DEFAULT_COIN_SELECTION_CONFIG, DEFAULT_TX
 from chia.wallet.util.wallet_types import CoinType, WalletType
 from chia.wallet.wallet import Wallet
 from chia.wallet.wallet_coin_record import WalletCoinRecord
-from chia.wallet.wallet_coin_store import GetCoinRecords
+from chia.wallet.wallet_coin_store import GetCoinRecords, WalletCoinStore
 from chia.wallet.wallet_node import WalletNode
 from chia.wallet.wallet_protocol import WalletProtocol
 
 log = logging.getLogger(__name__)
 
+# CAT with an anyone can spend TAIL and inner puzzle, used by test_cat_spend_run_tail
+_NIL_TREE_HASH = Program.to(None).get_tree_hash()
+_ONE_TREE_HASH = Program.to(1).get_tree_hash()
+_ACS_CAT_PUZZLE = construct_cat_puzzle(CAT_MOD, _NIL_TREE_HASH, Program.to(1))
+# CREATE_COIN with the magic -113 amount, which runs the TAIL
+_RUN_TAIL_CONDITION = Program.to([51, None, -113, None, None])
+
 
 @dataclasses.dataclass
 class WalletBundle:
@@ -285,6 +292,12 @@ async def get_unconfirmed_balance(client: WalletRpcClient, wallet_id: int):
     return (await client.get_wallet_balance(wallet_id))["unconfirmed_wallet_balance"]
 
 
+async def drop_coin_spent_index(store: WalletCoinStore) -> None:
+    # None of the coin record tests query by `spent`, so skip maintaining the index on each insert
+    async with store.db_wrapper.writer_maybe_transaction() as conn:
+        await conn.execute("DROP INDEX IF EXISTS coin_spent")
+
+
 def update_verify_signature_request(request: Dict[str, Any], prefix_hex_values: bool):
     updated_request = request.copy()
     updated_request["pubkey"] = ("0x" if prefix_hex_values else "") + updated_request["pubkey"]
@@ -1654,17 +1667,18 @@ async def _check_delete_key(
     assert sk_dict["used_for_farmer_rewards"] is True
     assert sk_dict["used_for_pool_rewards"] is False
 
-    # Check pool_fp key
-    sk_dict = await client.check_delete_key(pool_fp)
+    # Check pool_fp key and an unknown key, the unknown key never switches the logged in wallet so both can overlap.
+    # The farmer_fp check above can't be fused with the pool_fp one since each of them logs into its fingerprint.
+    sk_dict, unknown_sk_dict = await asyncio.gather(
+        client.check_delete_key(pool_fp), client.check_delete_key(123456, 10)
+    )
     assert sk_dict["fingerprint"] == pool_fp
     assert sk_dict["used_for_farmer_rewards"] is False
     assert sk_dict["used_for_pool_rewards"] is True
 
-    # Check unknown key
-    sk_dict = await client.check_delete_key(123456, 10)
-    assert sk_dict["fingerprint"] == 123456
-    assert sk_dict["used_for_farmer_rewards"] is False
-    assert sk_dict["used_for_pool_rewards"] is False
+    assert unknown_sk_dict["fingerprint"] == 123456
+    assert unknown_sk_dict["used_for_farmer_rewards"] is False
+    assert unknown_sk_dict["used_for_pool_rewards"] is False
 
 
 @pytest.mark.anyio
@@ -1798,6 +1812,7 @@ async def test_select_coins_rpc(wallet_rpc_environment: WalletRpcTestEnvironment
     )
     assert min_coins is not None
     assert len(min_coins) == 1 and min_coins[0].amount == uint64(10000)
+    min_coin_ids = [c.name() for c in min_coins]
 
     # test max coin amount
     max_coins: List[Coin] = await client_2.select_coins(
@@ -1822,20 +1837,20 @@ async def test_select_coins_rpc(wallet_rpc_environment: WalletRpcTestEnvironment
         len(excluded_amt_coins) == len(tuple(a for a in tx_amounts if a != 1000))
         and sum(c.amount for c in excluded_amt_coins) == non_1000_amt
     )
+    excluded_amt_coin_ids = [c.name() for c in excluded_amt_coins]
+    coin_300_ids = [c.name() for c in coin_300]
 
     # test excluded coins
     with pytest.raises(ValueError):
         await client_2.select_coins(
             amount=5000,
             wallet_id=1,
-            coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(
-                excluded_coin_ids=[c.name() for c in min_coins]
-            ),
+            coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(excluded_coin_ids=min_coin_ids),
         )
     excluded_test = await client_2.select_coins(
         amount=1300,
         wallet_id=1,
-        coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(excluded_coin_ids=[c.name() for c in coin_300]),
+        coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(excluded_coin_ids=coin_300_ids),
     )
     assert len(excluded_test) == 2
     for coin in excluded_test:
@@ -1857,22 +1872,22 @@ async def test_select_coins_rpc(wallet_rpc_environment: WalletRpcTestEnvironment
         assert coin != coin_300[0]
 
     # test get coins
-    all_coins, _, _ = await client_2.get_spendable_coins(
-        wallet_id=1,
-        coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(
-            excluded_coin_ids=[c.name() for c in excluded_amt_coins]
+    (all_coins, _, _), (all_coins_b, _, _), (all_coins_2, _, _) = await asyncio.gather(
+        client_2.get_spendable_coins(
+            wallet_id=1,
+            coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(excluded_coin_ids=excluded_amt_coin_ids),
+        ),
+        client_2.get_spendable_coins(
+            wallet_id=1,
+            coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(excluded_coin_amounts=[uint64(1000)]),
+        ),
+        client_2.get_spendable_coins(
+            wallet_id=1,
+            coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(max_coin_amount=uint64(999)),
         ),
     )
     assert set(excluded_amt_coins).intersection({rec.coin for rec in all_coins}) == set()
-    all_coins, _, _ = await client_2.get_spendable_coins(
-        wallet_id=1,
-        coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(excluded_coin_amounts=[uint64(1000)]),
-    )
-    assert len([rec for rec in all_coins if rec.coin.amount == 1000]) == 0
-    all_coins_2, _, _ = await client_2.get_spendable_coins(
-        wallet_id=1,
-        coin_selection_config=DEFAULT_COIN_SELECTION_CONFIG.override(max_coin_amount=uint64(999)),
-    )
+    assert len([rec for rec in all_coins_b if rec.coin.amount == 1000]) == 0
     assert all_coins_2[0].coin == coin_300[0]
     with pytest.raises(ValueError):  # validate fail on invalid coin id.
         await client_2.get_spendable_coins(
@@ -1887,9 +1902,13 @@ async def test_get_coin_records_rpc(wallet_rpc_environment: WalletRpcTestEnviron
     wallet_node: WalletNode = env.wallet_1.node
     client: WalletRpcClient = env.wallet_1.rpc_client
     store = wallet_node.wallet_state_manager.coin_store
+    await drop_coin_spent_index(store)
 
-    for record in [record_1, record_2, record_3, record_4, record_5, record_6, record_7, record_8, record_9]:
+    records = [record_1, record_2, record_3, record_4, record_5, record_6, record_7, record_8, record_9]
+    for record in records:
         await store.add_coin_record(record)
+    # The test cases only reference the records above, serialize each of them once up front
+    expected_json_records = {record.name(): record.to_json_dict_parsed_metadata() for record in records}
 
     async def run_test_case(
         test_case: str,
@@ -1898,7 +1917,7 @@ async def test_get_coin_records_rpc(wallet_rpc_environment: WalletRpcTestEnviron
         test_records: List[WalletCoinRecord],
     ):
         response = await client.get_coin_records(test_request)
-        assert response["coin_records"] == [coin.to_json_dict_parsed_metadata() for coin in test_records], test_case
+        assert response["coin_records"] == [expected_json_records[coin.name()] for coin in test_records], test_case
         assert response["total_count"] == test_total_count, test_case
 
     for name, tests in {
@@ -1959,6 +1978,7 @@ async def test_get_coin_records_rpc_limits(
         )
         for _ in range(max_coins)
     ]
+    await drop_coin_spent_index(store)
     for record in coin_records:
         await store.add_coin_record(record)
 
@@ -1971,9 +1991,10 @@ async def test_get_coin_records_rpc_limits(
 
     assert len(response_records) == max_coins
     # Make sure we got all expected records
-    parsed_records = [coin.to_json_dict_parsed_metadata() for coin in coin_records]
-    for expected_record in parsed_records:
-        assert expected_record in response_records
+    response_records_by_id = {record["id"]: record for record in response_records}
+    for coin in coin_records:
+        expected_record = coin.to_json_dict_parsed_metadata()
+        assert response_records_by_id.get(expected_record["id"]) == expected_record
 
     # Request coins with the max number of filter items
     max_filter_items = api.max_get_coin_records_filter_items
@@ -1995,9 +2016,10 @@ async def test_get_coin_records_rpc_limits(
         ),
     ]:
         response = await client.get_coin_records(request)
-        parsed_records = [coin.to_json_dict_parsed_metadata() for coin in filter_records]
-        for expected_record in parsed_records:
-            assert expected_record in response["coin_records"]
+        response_records_by_id = {record["id"]: record for record in response["coin_records"]}
+        for coin in filter_records:
+            expected_record = coin.to_json_dict_parsed_metadata()
+            assert response_records_by_id.get(expected_record["id"]) == expected_record
 
 
 @pytest.mark.anyio
@@ -2015,19 +2037,29 @@ async def test_get_coin_records_rpc_failures(
     too_many_amounts = [
         uint64(uint64(seeded_random.randrange(2**64))) for _ in range(api.max_get_coin_records_filter_items + 1)
     ]
+
+    async def expect_limit_error(name: str, request: GetCoinRecords) -> None:
+        with pytest.raises(ValueError, match=name):
+            await client.get_coin_records(request)
+
+    async def expect_type_error(field: str, value: Any) -> None:
+        with pytest.raises((ConversionError, InvalidTypeError, ValueError)):
+            json_dict = GetCoinRecords().to_json_dict()
+            json_dict[field] = value
+            await api.get_coin_records(json_dict)
+
     # Run requests which exceeds the allowed limit and contain too much filter items
-    for name, request in {
+    limit_requests = {
         "limit": GetCoinRecords(limit=uint32(api.max_get_coin_records_limit + 1)),
         "coin_id_filter": GetCoinRecords(coin_id_filter=HashFilter.include(too_many_hashes)),
         "puzzle_hash_filter": GetCoinRecords(puzzle_hash_filter=HashFilter.include(too_many_hashes)),
         "parent_coin_id_filter": GetCoinRecords(parent_coin_id_filter=HashFilter.include(too_many_hashes)),
         "amount_filter": GetCoinRecords(amount_filter=AmountFilter.include(too_many_amounts)),
-    }.items():
-        with pytest.raises(ValueError, match=name):
-            await client.get_coin_records(request)
+    }
+    await asyncio.gather(*(expect_limit_error(name, request) for name, request in limit_requests.items()))
 
     # Type validation is handled via `Streamable.from_json_dict´ but the below should make at least sure it triggers.
-    for field, value in {
+    invalid_values = {
         "offset": "invalid",
         "limit": "invalid",
         "wallet_id": "invalid",
@@ -2041,11 +2073,8 @@ async def test_get_coin_records_rpc_failures(
         "confirmed_range": "invalid",
         "spent_range": "invalid",
         "order": 8,
-    }.items():
-        with pytest.raises((ConversionError, InvalidTypeError, ValueError)):
-            json_dict = GetCoinRecords().to_json_dict()
-            json_dict[field] = value
-            await api.get_coin_records(json_dict)
+    }
+    await asyncio.gather(*(expect_type_error(field, value) for field, value in invalid_values.items()))
 
 
 @pytest.mark.anyio
@@ -2062,8 +2091,9 @@ async def test_notification_rpcs(wallet_rpc_environment: WalletRpcTestEnvironmen
 
     env.wallet_2.node.config["enable_notifications"] = True
     env.wallet_2.node.config["required_notification_amount"] = 100000000000
+    notification_target = await wallet_2.get_new_puzzlehash()
     tx = await client.send_notification(
-        await wallet_2.get_new_puzzlehash(),
+        notification_target,
         b"hello",
         uint64(100000000000),
         fee=uint64(100000000000),
@@ -2089,7 +2119,7 @@ async def test_notification_rpcs(wallet_rpc_environment: WalletRpcTestEnvironmen
     assert [] == (await client_2.get_notifications(GetNotifications([notification.id]))).notifications
 
     tx = await client.send_notification(
-        await wallet_2.get_new_puzzlehash(),
+        notification_target,
         b"hello",
         uint64(100000000000),
         fee=uint64(100000000000),
@@ -2315,7 +2345,6 @@ async def test_set_wallet_resync_on_startup(wallet_rpc_environment: WalletRpcTes
     await wc.create_new_did_wallet(1, DEFAULT_TX_CONFIG, 0)
     await time_out_assert(5, check_mempool_spend_count, True, full_node_api, 1)
     await farm_transaction_block(full_node_api, env.wallet_1.node)
-    await time_out_assert(20, wc.get_synced)
 
     nft_wallet = await wc.create_new_nft_wallet(None)
     nft_wallet_id = nft_wallet["wallet_id"]
@@ -2330,7 +2359,6 @@ async def test_set_wallet_resync_on_startup(wallet_rpc_environment: WalletRpcTes
     )
     await time_out_assert(5, check_mempool_spend_count, True, full_node_api, 1)
     await farm_transaction_block(full_node_api, env.wallet_1.node)
-    await time_out_assert(20, wc.get_synced)
 
     wallet_node: WalletNode = env.wallet_1.node
     wallet_node_2: WalletNode = env.wallet_2.node
@@ -2346,7 +2374,6 @@ async def test_set_wallet_resync_on_startup(wallet_rpc_environment: WalletRpcTes
     clawback_coin_id = tx.additions[0].name()
     assert tx.spend_bundle is not None
     await farm_transaction(full_node_api, wallet_node, tx.spend_bundle)
-    await time_out_assert(20, wc.get_synced)
     await asyncio.sleep(10)
     resp = await wc.spend_clawback_coins([clawback_coin_id], 0)
     assert resp["success"]
@@ -2354,20 +2381,26 @@ async def test_set_wallet_resync_on_startup(wallet_rpc_environment: WalletRpcTes
     await time_out_assert_not_none(
         10, full_node_api.full_node.mempool_manager.get_spendbundle, bytes32.from_hexstr(resp["transaction_ids"][0])
     )
+    # `farm_transaction_block` already waits for the wallet to be synced, no need to poll `get_synced` afterwards
     await farm_transaction_block(full_node_api, wallet_node)
-    await time_out_assert(20, wc.get_synced)
     wallet_node_2._close()
     await wallet_node_2._await_closed()
     # set flag to reset wallet sync data on start
     await client.set_wallet_resync_on_startup()
     fingerprint = wallet_node.logged_in_fingerprint
-    assert wallet_node._wallet_state_manager
+    wallet_state_manager = wallet_node._wallet_state_manager
+    assert wallet_state_manager
+    unspent_coins, nft_count, wallet_infos, before_txs = await asyncio.gather(
+        wallet_state_manager.coin_store.get_all_unspent_coins(),
+        wallet_state_manager.nft_store.count(),
+        wallet_state_manager.user_store.get_all_wallet_info_entries(),
+        wallet_state_manager.tx_store.get_all_transactions(),
+    )
     # 2 reward coins, 1 DID, 1 NFT, 1 clawbacked coin
-    assert len(await wallet_node._wallet_state_manager.coin_store.get_all_unspent_coins()) == 5
-    assert await wallet_node._wallet_state_manager.nft_store.count() == 1
+    assert len(unspent_coins) == 5
+    assert nft_count == 1
     # standard wallet, did wallet, nft wallet, did nft wallet
-    assert len(await wallet_node.wallet_state_manager.user_store.get_all_wallet_info_entries()) == 4
-    before_txs = await wallet_node.wallet_state_manager.tx_store.get_all_transactions()
+    assert len(wallet_infos) == 4
     wallet_node._close()
     await wallet_node._await_closed()
     config = load_config(wallet_node.root_path, "config.yaml")
@@ -2380,19 +2413,25 @@ async def test_set_wallet_resync_on_startup(wallet_rpc_environment: WalletRpcTes
     wallet_node_2.local_keychain = wallet_node.local_keychain
     # use second node to start the same wallet, reusing config and db
     await wallet_node_2._start_with_fingerprint(fingerprint)
-    assert wallet_node_2._wallet_state_manager
-    after_txs = await wallet_node_2.wallet_state_manager.tx_store.get_all_transactions()
+    wallet_state_manager_2 = wallet_node_2._wallet_state_manager
+    assert wallet_state_manager_2
+    after_txs, clawback_tx, unspent_coins, nft_count, wallet_infos = await asyncio.gather(
+        wallet_state_manager_2.tx_store.get_all_transactions(),
+        wallet_state_manager_2.tx_store.get_transaction_record(clawback_coin_id),
+        wallet_state_manager_2.coin_store.get_all_unspent_coins(),
+        wallet_state_manager_2.nft_store.count(),
+        wallet_state_manager_2.user_store.get_all_wallet_info_entries(),
+    )
     # transactions should be the same
     assert after_txs == before_txs
     # Check clawback
-    clawback_tx = await wallet_node_2.wallet_state_manager.tx_store.get_transaction_record(clawback_coin_id)
     assert clawback_tx is not None
     assert clawback_tx.confirmed
     # only coin_store was populated in this case, but now should be empty
-    assert len(await wallet_node_2._wallet_state_manager.coin_store.get_all_unspent_coins()) == 0
-    assert await wallet_node_2._wallet_state_manager.nft_store.count() == 0
+    assert len(unspent_coins) == 0
+    assert nft_count == 0
     # we don't delete wallets
-    assert len(await wallet_node_2.wallet_state_manager.user_store.get_all_wallet_info_entries()) == 4
+    assert len(wallet_infos) == 4
     updated_config = load_config(wallet_node.root_path, "config.yaml")
     # check that it's disabled after reset
     assert updated_config["wallet"].get("reset_sync_for_fingerprint") is None
@@ -2413,9 +2452,13 @@ async def test_set_wallet_resync_on_startup_disable(wallet_rpc_environment: Wall
     # set flag to reset wallet sync data on start
     await client.set_wallet_resync_on_startup()
     fingerprint = wallet_node.logged_in_fingerprint
-    assert wallet_node._wallet_state_manager
-    assert len(await wallet_node._wallet_state_manager.coin_store.get_all_unspent_coins()) == 2
-    before_txs = await wallet_node.wallet_state_manager.tx_store.get_all_transactions()
+    wallet_state_manager = wallet_node._wallet_state_manager
+    assert wallet_state_manager
+    unspent_coins, before_txs = await asyncio.gather(
+        wallet_state_manager.coin_store.get_all_unspent_coins(),
+        wallet_state_manager.tx_store.get_all_transactions(),
+    )
+    assert len(unspent_coins) == 2
     await client.set_wallet_resync_on_startup(False)
     wallet_node._close()
     await wallet_node._await_closed()
@@ -2429,12 +2472,16 @@ async def test_set_wallet_resync_on_startup_disable(wallet_rpc_environment: Wall
     wallet_node_2.local_keychain = wallet_node.local_keychain
     # use second node to start the same wallet, reusing config and db
     await wallet_node_2._start_with_fingerprint(fingerprint)
-    assert wallet_node_2._wallet_state_manager
-    after_txs = await wallet_node_2.wallet_state_manager.tx_store.get_all_transactions()
+    wallet_state_manager_2 = wallet_node_2._wallet_state_manager
+    assert wallet_state_manager_2
+    after_txs, unspent_coins = await asyncio.gather(
+        wallet_state_manager_2.tx_store.get_all_transactions(),
+        wallet_state_manager_2.coin_store.get_all_unspent_coins(),
+    )
     # transactions should be the same
     assert after_txs == before_txs
     # only coin_store was populated in this case, but now should be empty
-    assert len(await wallet_node_2._wallet_state_manager.coin_store.get_all_unspent_coins()) == 2
+    assert len(unspent_coins) == 2
     wallet_node_2._close()
     await wallet_node_2._await_closed()
 
@@ -2480,7 +2527,7 @@ async def test_cat_spend_run_tail(wallet_rpc_environment: WalletRpcTestEnvironme
 
     # Send to a CAT with an anyone can spend TAIL
     our_ph: bytes32 = await env.wallet_1.wallet.get_new_puzzlehash()
-    cat_puzzle: Program = construct_cat_puzzle(CAT_MOD, Program.to(None).get_tree_hash(), Program.to(1))
+    cat_puzzle: Program = _ACS_CAT_PUZZLE
     addr = encode_puzzle_hash(
         cat_puzzle.get_tree_hash(),
         "txch",
@@ -2504,11 +2551,11 @@ async def test_cat_spend_run_tail(wallet_rpc_environment: WalletRpcTestEnvironme
                 cat_puzzle,
                 Program.to(
                     [
-                        Program.to([[51, our_ph, tx_amount, [our_ph]], [51, None, -113, None, None]]),
+                        Program.to([[51, our_ph, tx_amount, [our_ph]], _RUN_TAIL_CONDITION]),
                         None,
                         cat_coin.name(),
                         coin_as_list(cat_coin),
-                        [cat_coin.parent_coin_info, Program.to(1).get_tree_hash(), cat_coin.amount],
+                        [cat_coin.parent_coin_info, _ONE_TREE_HASH, cat_coin.amount],
                         0,
                         0,
                     ]
@@ -2521,7 +2568,7 @@ async def test_cat_spend_run_tail(wallet_rpc_environment: WalletRpcTestEnvironme
     await farm_transaction(full_node_api, wallet_node, eve_spend)
 
     # Make sure we have the CAT
-    res = await client.create_wallet_for_existing_cat(Program.to(None).get_tree_hash())
+    res = await client.create_wallet_for_existing_cat(_NIL_TREE_HASH)
     assert res["success"]
     cat_wallet_id = res["wallet_id"]
     await time_out_assert(20, get_confirmed_balance, tx_amount, client, cat_wallet_id)
@@ -2558,13 +2605,10 @@ async def test_get_balances(wallet_rpc_environment: WalletRpcTestEnvironment):
     await time_out_assert(20, client.get_synced)
     # Creates a CAT wallet with 100 mojos and a CAT with 20 mojos
     await client.create_new_cat_and_wallet(uint64(100), test=True)
-
-    await time_out_assert(20, client.get_synced)
     res = await client.create_new_cat_and_wallet(uint64(20), test=True)
     assert res["success"]
     await time_out_assert(5, check_mempool_spend_count, True, full_node_api, 2)
     await farm_transaction_block(full_node_api, wallet_node)
-    await time_out_assert(20, client.get_synced)
     bal = await client.get_wallet_balances()
     assert len(bal) == 3
     assert bal["1"]["confirmed_wallet_balance"] == 1999999999880
@@ -56,6 +56,20 @@ async def test_add() -> None:
         assert await store.get_transaction_record(tr1.name) == tr1
 
 
+@pytest.mark.anyio
+async def test_add_multiple(seeded_random: random.Random) -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await WalletTransactionStore.create(db_wrapper)
+
+        records = [tr1, *(dataclasses.replace(tr1, name=bytes32.random(seeded_random)) for _ in range(3))]
+        await store.add_transaction_records(records)
+        for record in records:
+            assert await store.get_transaction_record(record.name) == record
+
+        await store.add_transaction_records([])
+        assert len(await store.get_all_transactions()) == len(records)
+
+
 @pytest.mark.anyio
 async def test_delete() -> None:
     async with DBConnection(1) as db_wrapper:
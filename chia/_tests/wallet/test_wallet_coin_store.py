@@ -266,6 +266,30 @@ async def test_get_unspent_coins_for_wallet() -> None:
         assert await store.get_unspent_coins_for_wallet(1, coin_type=CoinType.CLAWBACK) == {record_8}
 
 
+@pytest.mark.anyio
+async def test_get_unspent_amount_for_wallet() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await WalletCoinStore.create(db_wrapper)
+
+        assert await store.get_unspent_amount_for_wallet(1) == 0
+
+        await store.add_coin_record(record_4)  # this is spent and wallet 0
+        await store.add_coin_record(record_5)  # wallet 1
+        await store.add_coin_record(record_6)  # this is spent and wallet 2
+        await store.add_coin_record(record_7)  # wallet 2
+        await store.add_coin_record(record_8)
+
+        assert await store.get_unspent_amount_for_wallet(1) == coin_5.amount
+        assert await store.get_unspent_amount_for_wallet(2) == coin_7.amount
+        assert await store.get_unspent_amount_for_wallet(3) == 0
+        assert await store.get_unspent_amount_for_wallet(1, coin_type=CoinType.CLAWBACK) == coin_8.amount
+
+        await store.set_spent(coin_7.name(), uint32(12))
+
+        assert await store.get_unspent_amount_for_wallet(1) == coin_5.amount
+        assert await store.get_unspent_amount_for_wallet(2) == 0
+
+
 @pytest.mark.anyio
 async def test_get_all_unspent_coins() -> None:
     async with DBConnection(1) as db_wrapper:
@@ -4,13 +4,15 @@ import asyncio
 import contextlib
 import json
 import logging
+import ssl
 import sys
 import time
 import traceback
+from collections import deque
 from dataclasses import dataclass
 from math import floor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Deque, Dict, List, Optional, Set, Tuple, Union, cast
 
 import aiohttp
 from chia_rs import AugSchemeMPL, G1Element, G2Element, PrivateKey
@@ -19,7 +21,7 @@ from chia.consensus.constants import ConsensusConstants
 from chia.daemon.keychain_proxy import KeychainProxy, connect_to_keychain_and_validate, wrap_local_keychain
 from chia.plot_sync.delta import Delta
 from chia.plot_sync.receiver import Receiver
-from chia.pools.pool_config import PoolWalletConfig, load_pool_config, update_pool_url
+from chia.pools.pool_config import PoolWalletConfig, get_pool_config_list, update_pool_url
 from chia.protocols import farmer_protocol, harvester_protocol
 from chia.protocols.pool_protocol import (
     AuthenticationPayload,
@@ -73,14 +75,10 @@ class GetPoolInfoResult:
     new_pool_url: Optional[str]
 
 
-def strip_old_entries(pairs: List[Tuple[float, Any]], before: float) -> List[Tuple[float, Any]]:
-    for index, [timestamp, points] in enumerate(pairs):
-        if timestamp >= before:
-            if index == 0:
-                return pairs
-            if index > 0:
-                return pairs[index:]
-    return []
+def strip_old_entries(pairs: Deque[Tuple[float, Any]], before: float) -> None:
+    # Entries are appended in time order, so only the oldest ones ever need to be dropped
+    while len(pairs) > 0 and pairs[0][0] < before:
+        pairs.popleft()
 
 
 def increment_pool_stats(
@@ -94,19 +92,21 @@ def increment_pool_stats(
     if p2_singleton_puzzlehash not in pool_states:
         return
     pool_state = pool_states[p2_singleton_puzzlehash]
-    if f"{name}_since_start" in pool_state:
-        pool_state[f"{name}_since_start"] += count
-    if f"{name}_24h" in pool_state:
+    since_start_key = f"{name}_since_start"
+    if since_start_key in pool_state:
+        pool_state[since_start_key] += count
+    entries_24h: Optional[Deque[Tuple[float, Any]]] = pool_state.get(f"{name}_24h")
+    if entries_24h is not None:
         if value is None:
-            pool_state[f"{name}_24h"].append((uint32(current_time), pool_state["current_difficulty"]))
+            entries_24h.append((uint32(current_time), pool_state["current_difficulty"]))
         else:
-            pool_state[f"{name}_24h"].append((uint32(current_time), value))
+            entries_24h.append((uint32(current_time), value))
 
         # Age out old 24h information for every signage point regardless
         # of any failures.  Note that this still lets old data remain if
         # the client isn't receiving signage points.
         cutoff_24h = current_time - (24 * 60 * 60)
-        pool_state[f"{name}_24h"] = strip_old_entries(pairs=pool_state[f"{name}_24h"], before=cutoff_24h)
+        strip_old_entries(pairs=entries_24h, before=cutoff_24h)
     return
 
 
@@ -163,6 +163,8 @@ class Farmer:
         self.log.addFilter(TimedDuplicateFilter("No pool specific difficulty has been set.*", 60 * 10))
 
         self.started = False
+        # Set together with `started` so that waiting harvester handshakes wake up right away
+        self._started_event = asyncio.Event()
         self.harvester_handshake_task: Optional[asyncio.Task[None]] = None
 
         # From p2_singleton_puzzle_hash to pool state dict
@@ -176,9 +178,20 @@ class Farmer:
 
         self.all_root_sks: List[PrivateKey] = []
 
+        # Last reward target key search, deriving the puzzle hashes is expensive and the GUI polls it.
+        # ((farmer_target, pool_target, max_ph_to_search, root sks), (have_farmer_sk, have_pool_sk))
+        self._reward_targets_search: Optional[
+            Tuple[Tuple[bytes32, bytes32, int, Tuple[bytes, ...]], Tuple[bool, bool]]
+        ] = None
+
         # Use to find missing signage points. (new_signage_point, time)
         self.prev_signage_point: Optional[Tuple[uint64, farmer_protocol.NewSignagePoint]] = None
 
+        # Shared by all pool HTTP requests so connections to the pools are kept alive and reused
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Built on first use, loading the CA bundle is expensive and its content doesn't change
+        self._pool_ssl_context: Optional[ssl.SSLContext] = None
+
     @contextlib.asynccontextmanager
     async def manage(self) -> AsyncIterator[None]:
         async def start_task() -> None:
@@ -190,6 +203,7 @@ class Farmer:
                     self.cache_clear_task = asyncio.create_task(self._periodically_clear_cache_and_refresh_task())
                     log.debug("start_task: initialized")
                     self.started = True
+                    self._started_event.set()
                     return
                 await asyncio.sleep(1)
 
@@ -199,6 +213,7 @@ class Farmer:
             else:
                 asyncio.create_task(profile_task(self._root_path, "farmer", self.log))
 
+        self._http_session = aiohttp.ClientSession(trust_env=True)
         asyncio.create_task(start_task())
         try:
             yield
@@ -214,7 +229,22 @@ class Farmer:
                 self.keychain_proxy = None
                 await proxy.close()
                 await asyncio.sleep(0.5)  # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
+            await self._http_session.close()
+            self._http_session = None
             self.started = False
+            self._started_event.clear()
+
+    @property
+    def http_session(self) -> aiohttp.ClientSession:
+        if self._http_session is None:
+            raise RuntimeError("The HTTP session is only available while the farmer is running")
+        return self._http_session
+
+    @property
+    def pool_ssl_context(self) -> ssl.SSLContext:
+        if self._pool_ssl_context is None:
+            self._pool_ssl_context = ssl_context_for_root(get_mozilla_ca_crt(), log=self.log)
+        return self._pool_ssl_context
 
     def get_connections(self, request_node_type: Optional[NodeType]) -> List[Dict[str, Any]]:
         return default_get_connections(server=self.server, request_node_type=request_node_type)
@@ -286,7 +316,8 @@ class Farmer:
             # Wait until the task in `Farmer._start` is done so that we have keys available for the handshake. Bail out
             # early if we need to shut down or if the harvester is not longer connected.
             while not self.started and not self._shut_down and peer in self.server.get_connections():
-                await asyncio.sleep(1)
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._started_event.wait(), timeout=1)
 
             if self._shut_down:
                 log.debug("handshake_task: shutdown")
@@ -344,22 +375,21 @@ class Farmer:
 
     async def _pool_get_pool_info(self, pool_config: PoolWalletConfig) -> Optional[GetPoolInfoResult]:
         try:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                url = f"{pool_config.pool_url}/pool_info"
-                async with session.get(url, ssl=ssl_context_for_root(get_mozilla_ca_crt(), log=self.log)) as resp:
-                    if resp.ok:
-                        response: Dict[str, Any] = json.loads(await resp.text())
-                        self.log.info(f"GET /pool_info response: {response}")
-                        new_pool_url: Optional[str] = None
-                        if resp.url != url and all(r.status in {301, 308} for r in resp.history):
-                            new_pool_url = f"{resp.url}".replace("/pool_info", "")
-
-                        return GetPoolInfoResult(pool_info=response, new_pool_url=new_pool_url)
-                    else:
-                        self.handle_failed_pool_response(
-                            pool_config.p2_singleton_puzzle_hash,
-                            f"Error in GET /pool_info {pool_config.pool_url}, {resp.status}",
-                        )
+            url = f"{pool_config.pool_url}/pool_info"
+            async with self.http_session.get(url, ssl=self.pool_ssl_context) as resp:
+                if resp.ok:
+                    response: Dict[str, Any] = json.loads(await resp.text())
+                    self.log.info(f"GET /pool_info response: {response}")
+                    new_pool_url: Optional[str] = None
+                    if resp.url != url and all(r.status in {301, 308} for r in resp.history):
+                        new_pool_url = f"{resp.url}".replace("/pool_info", "")
+
+                    return GetPoolInfoResult(pool_info=response, new_pool_url=new_pool_url)
+                else:
+                    self.handle_failed_pool_response(
+                        pool_config.p2_singleton_puzzle_hash,
+                        f"Error in GET /pool_info {pool_config.pool_url}, {resp.status}",
+                    )
 
         except Exception as e:
             self.handle_failed_pool_response(
@@ -384,31 +414,30 @@ class Farmer:
             "signature": bytes(signature).hex(),
         }
         try:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(
-                    f"{pool_config.pool_url}/farmer",
-                    params=get_farmer_params,
-                    ssl=ssl_context_for_root(get_mozilla_ca_crt(), log=self.log),
-                ) as resp:
-                    if resp.ok:
-                        response: Dict[str, Any] = json.loads(await resp.text())
-                        log_level = logging.INFO
-                        if "error_code" in response:
-                            log_level = logging.WARNING
-                            increment_pool_stats(
-                                self.pool_state,
-                                pool_config.p2_singleton_puzzle_hash,
-                                "pool_errors",
-                                time.time(),
-                                value=response,
-                            )
-                        self.log.log(log_level, f"GET /farmer response: {response}")
-                        return response
-                    else:
-                        self.handle_failed_pool_response(
+            async with self.http_session.get(
+                f"{pool_config.pool_url}/farmer",
+                params=get_farmer_params,
+                ssl=self.pool_ssl_context,
+            ) as resp:
+                if resp.ok:
+                    response: Dict[str, Any] = json.loads(await resp.text())
+                    log_level = logging.INFO
+                    if "error_code" in response:
+                        log_level = logging.WARNING
+                        increment_pool_stats(
+                            self.pool_state,
                             pool_config.p2_singleton_puzzle_hash,
-                            f"Error in GET /farmer {pool_config.pool_url}, {resp.status}",
+                            "pool_errors",
+                            time.time(),
+                            value=response,
                         )
+                    self.log.log(log_level, f"GET /farmer response: {response}")
+                    return response
+                else:
+                    self.handle_failed_pool_response(
+                        pool_config.p2_singleton_puzzle_hash,
+                        f"Error in GET /farmer {pool_config.pool_url}, {resp.status}",
+                    )
         except Exception as e:
             self.handle_failed_pool_response(
                 pool_config.p2_singleton_puzzle_hash, f"Exception in GET /farmer {pool_config.pool_url}, {e}"
@@ -432,31 +461,30 @@ class Farmer:
         post_farmer_request = PostFarmerRequest(post_farmer_payload, signature)
         self.log.debug(f"POST /farmer request {post_farmer_request}")
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{pool_config.pool_url}/farmer",
-                    json=post_farmer_request.to_json_dict(),
-                    ssl=ssl_context_for_root(get_mozilla_ca_crt(), log=self.log),
-                ) as resp:
-                    if resp.ok:
-                        response: Dict[str, Any] = json.loads(await resp.text())
-                        log_level = logging.INFO
-                        if "error_code" in response:
-                            log_level = logging.WARNING
-                            increment_pool_stats(
-                                self.pool_state,
-                                pool_config.p2_singleton_puzzle_hash,
-                                "pool_errors",
-                                time.time(),
-                                value=response,
-                            )
-                        self.log.log(log_level, f"POST /farmer response: {response}")
-                        return response
-                    else:
-                        self.handle_failed_pool_response(
+            async with self.http_session.post(
+                f"{pool_config.pool_url}/farmer",
+                json=post_farmer_request.to_json_dict(),
+                ssl=self.pool_ssl_context,
+            ) as resp:
+                if resp.ok:
+                    response: Dict[str, Any] = json.loads(await resp.text())
+                    log_level = logging.INFO
+                    if "error_code" in response:
+                        log_level = logging.WARNING
+                        increment_pool_stats(
+                            self.pool_state,
                             pool_config.p2_singleton_puzzle_hash,
-                            f"Error in POST /farmer {pool_config.pool_url}, {resp.status}",
+                            "pool_errors",
+                            time.time(),
+                            value=response,
                         )
+                    self.log.log(log_level, f"POST /farmer response: {response}")
+                    return response
+                else:
+                    self.handle_failed_pool_response(
+                        pool_config.p2_singleton_puzzle_hash,
+                        f"Error in POST /farmer {pool_config.pool_url}, {resp.status}",
+                    )
         except Exception as e:
             self.handle_failed_pool_response(
                 pool_config.p2_singleton_puzzle_hash, f"Exception in POST /farmer {pool_config.pool_url}, {e}"
@@ -480,30 +508,29 @@ class Farmer:
         put_farmer_request = PutFarmerRequest(put_farmer_payload, signature)
         self.log.debug(f"PUT /farmer request {put_farmer_request}")
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.put(
-                    f"{pool_config.pool_url}/farmer",
-                    json=put_farmer_request.to_json_dict(),
-                    ssl=ssl_context_for_root(get_mozilla_ca_crt(), log=self.log),
-                ) as resp:
-                    if resp.ok:
-                        response: Dict[str, Any] = json.loads(await resp.text())
-                        log_level = logging.INFO
-                        if "error_code" in response:
-                            log_level = logging.WARNING
-                            increment_pool_stats(
-                                self.pool_state,
-                                pool_config.p2_singleton_puzzle_hash,
-                                "pool_errors",
-                                time.time(),
-                                value=response,
-                            )
-                        self.log.log(log_level, f"PUT /farmer response: {response}")
-                    else:
-                        self.handle_failed_pool_response(
+            async with self.http_session.put(
+                f"{pool_config.pool_url}/farmer",
+                json=put_farmer_request.to_json_dict(),
+                ssl=self.pool_ssl_context,
+            ) as resp:
+                if resp.ok:
+                    response: Dict[str, Any] = json.loads(await resp.text())
+                    log_level = logging.INFO
+                    if "error_code" in response:
+                        log_level = logging.WARNING
+                        increment_pool_stats(
+                            self.pool_state,
                             pool_config.p2_singleton_puzzle_hash,
-                            f"Error in PUT /farmer {pool_config.pool_url}, {resp.status}",
+                            "pool_errors",
+                            time.time(),
+                            value=response,
                         )
+                    self.log.log(log_level, f"PUT /farmer response: {response}")
+                else:
+                    self.handle_failed_pool_response(
+                        pool_config.p2_singleton_puzzle_hash,
+                        f"Error in PUT /farmer {pool_config.pool_url}, {resp.status}",
+                    )
         except Exception as e:
             self.handle_failed_pool_response(
                 pool_config.p2_singleton_puzzle_hash, f"Exception in PUT /farmer {pool_config.pool_url}, {e}"
@@ -519,143 +546,142 @@ class Farmer:
 
     async def update_pool_state(self) -> None:
         config = load_config(self._root_path, "config.yaml")
+        enforce_https = config["full_node"]["selected_network"] == "mainnet"
 
-        pool_config_list: List[PoolWalletConfig] = load_pool_config(self._root_path)
-        for pool_config in pool_config_list:
-            p2_singleton_puzzle_hash = pool_config.p2_singleton_puzzle_hash
+        pool_config_list: List[PoolWalletConfig] = get_pool_config_list(config)
+        # Pools are independent of each other, refresh them concurrently
+        await asyncio.gather(
+            *(self._update_pool_state_for(pool_config, enforce_https) for pool_config in pool_config_list)
+        )
 
-            try:
-                authentication_sk: Optional[PrivateKey] = self.get_authentication_sk(pool_config)
-
-                if authentication_sk is None:
-                    self.log.error(f"Could not find authentication sk for {p2_singleton_puzzle_hash}")
-                    continue
-
-                if p2_singleton_puzzle_hash not in self.pool_state:
-                    self.pool_state[p2_singleton_puzzle_hash] = {
-                        "p2_singleton_puzzle_hash": p2_singleton_puzzle_hash.hex(),
-                        "points_found_since_start": 0,
-                        "points_found_24h": [],
-                        "points_acknowledged_since_start": 0,
-                        "points_acknowledged_24h": [],
-                        "next_farmer_update": 0,
-                        "next_pool_info_update": 0,
-                        "current_points": 0,
-                        "current_difficulty": None,
-                        "pool_errors_24h": [],
-                        "valid_partials_since_start": 0,
-                        "valid_partials_24h": [],
-                        "invalid_partials_since_start": 0,
-                        "invalid_partials_24h": [],
-                        "insufficient_partials_since_start": 0,
-                        "insufficient_partials_24h": [],
-                        "stale_partials_since_start": 0,
-                        "stale_partials_24h": [],
-                        "missing_partials_since_start": 0,
-                        "missing_partials_24h": [],
-                        "authentication_token_timeout": None,
-                        "plot_count": 0,
-                        "pool_config": pool_config,
-                    }
-                    self.log.info(f"Added pool: {pool_config}")
+    async def _update_pool_state_for(self, pool_config: PoolWalletConfig, enforce_https: bool) -> None:
+        p2_singleton_puzzle_hash = pool_config.p2_singleton_puzzle_hash
+
+        try:
+            authentication_sk: Optional[PrivateKey] = self.get_authentication_sk(pool_config)
+
+            if authentication_sk is None:
+                self.log.error(f"Could not find authentication sk for {p2_singleton_puzzle_hash}")
+                return
+
+            if p2_singleton_puzzle_hash not in self.pool_state:
+                self.pool_state[p2_singleton_puzzle_hash] = {
+                    "p2_singleton_puzzle_hash": p2_singleton_puzzle_hash.hex(),
+                    "points_found_since_start": 0,
+                    "points_found_24h": deque(),
+                    "points_acknowledged_since_start": 0,
+                    "points_acknowledged_24h": deque(),
+                    "next_farmer_update": 0,
+                    "next_pool_info_update": 0,
+                    "current_points": 0,
+                    "current_difficulty": None,
+                    "pool_errors_24h": deque(),
+                    "valid_partials_since_start": 0,
+                    "valid_partials_24h": deque(),
+                    "invalid_partials_since_start": 0,
+                    "invalid_partials_24h": deque(),
+                    "insufficient_partials_since_start": 0,
+                    "insufficient_partials_24h": deque(),
+                    "stale_partials_since_start": 0,
+                    "stale_partials_24h": deque(),
+                    "missing_partials_since_start": 0,
+                    "missing_partials_24h": deque(),
+                    "authentication_token_timeout": None,
+                    "plot_count": 0,
+                    "pool_config": pool_config,
+                }
+                self.log.info(f"Added pool: {pool_config}")
+            else:
+                self.pool_state[p2_singleton_puzzle_hash]["pool_config"] = pool_config
+
+            pool_state = self.pool_state[p2_singleton_puzzle_hash]
+
+            # Skip state update when self pooling
+            if pool_config.pool_url == "":
+                return
+
+            if enforce_https and not pool_config.pool_url.startswith("https://"):
+                self.log.error(f"Pool URLs must be HTTPS on mainnet {pool_config.pool_url}")
+                return
+
+            now = time.time()
+            # TODO: Improve error handling below, inform about unexpected failures
+            if now >= pool_state["next_pool_info_update"]:
+                pool_state["next_pool_info_update"] = now + UPDATE_POOL_INFO_INTERVAL
+                # Makes a GET request to the pool to get the updated information
+                pool_info_result = await self._pool_get_pool_info(pool_config)
+                if pool_info_result is not None and "error_code" not in pool_info_result.pool_info:
+                    pool_info = pool_info_result.pool_info
+                    pool_state["authentication_token_timeout"] = pool_info["authentication_token_timeout"]
+                    # Only update the first time from GET /pool_info, gets updated from GET /farmer later
+                    if pool_state["current_difficulty"] is None:
+                        pool_state["current_difficulty"] = pool_info["minimum_difficulty"]
                 else:
-                    self.pool_state[p2_singleton_puzzle_hash]["pool_config"] = pool_config
-
-                pool_state = self.pool_state[p2_singleton_puzzle_hash]
-
-                # Skip state update when self pooling
-                if pool_config.pool_url == "":
-                    continue
-
-                enforce_https = config["full_node"]["selected_network"] == "mainnet"
-                if enforce_https and not pool_config.pool_url.startswith("https://"):
-                    self.log.error(f"Pool URLs must be HTTPS on mainnet {pool_config.pool_url}")
-                    continue
-
-                # TODO: Improve error handling below, inform about unexpected failures
-                if time.time() >= pool_state["next_pool_info_update"]:
-                    pool_state["next_pool_info_update"] = time.time() + UPDATE_POOL_INFO_INTERVAL
-                    # Makes a GET request to the pool to get the updated information
-                    pool_info_result = await self._pool_get_pool_info(pool_config)
-                    if pool_info_result is not None and "error_code" not in pool_info_result.pool_info:
-                        pool_info = pool_info_result.pool_info
-                        pool_state["authentication_token_timeout"] = pool_info["authentication_token_timeout"]
-                        # Only update the first time from GET /pool_info, gets updated from GET /farmer later
-                        if pool_state["current_difficulty"] is None:
-                            pool_state["current_difficulty"] = pool_info["minimum_difficulty"]
-                    else:
-                        pool_state["next_pool_info_update"] = time.time() + UPDATE_POOL_INFO_FAILURE_RETRY_INTERVAL
-
-                    if pool_info_result is not None and pool_info_result.new_pool_url is not None:
-                        update_pool_url(self._root_path, pool_config, pool_info_result.new_pool_url)
-
-                if time.time() >= pool_state["next_farmer_update"]:
-                    pool_state["next_farmer_update"] = time.time() + UPDATE_POOL_FARMER_INFO_INTERVAL
-                    authentication_token_timeout = pool_state["authentication_token_timeout"]
-
-                    async def update_pool_farmer_info() -> Tuple[Optional[GetFarmerResponse], Optional[PoolErrorCode]]:
-                        # Run a GET /farmer to see if the farmer is already known by the pool
-                        response = await self._pool_get_farmer(
-                            pool_config, authentication_token_timeout, authentication_sk
-                        )
-                        farmer_response: Optional[GetFarmerResponse] = None
-                        error_code_response: Optional[PoolErrorCode] = None
-                        if response is not None:
-                            if "error_code" not in response:
-                                farmer_response = GetFarmerResponse.from_json_dict(response)
-                                if farmer_response is not None:
-                                    pool_state["current_difficulty"] = farmer_response.current_difficulty
-                                    pool_state["current_points"] = farmer_response.current_points
-                            else:
-                                try:
-                                    error_code_response = PoolErrorCode(response["error_code"])
-                                except ValueError:
-                                    self.log.error(
-                                        f"Invalid error code received from the pool: {response['error_code']}"
-                                    )
-
-                        return farmer_response, error_code_response
-
-                    if authentication_token_timeout is not None:
-                        farmer_info, error_code = await update_pool_farmer_info()
-                        if error_code == PoolErrorCode.FARMER_NOT_KNOWN:
-                            # Make the farmer known on the pool with a POST /farmer
-                            owner_sk_and_index = find_owner_sk(self.all_root_sks, pool_config.owner_public_key)
-                            assert owner_sk_and_index is not None
-                            post_response = await self._pool_post_farmer(
-                                pool_config, authentication_token_timeout, owner_sk_and_index[0]
-                            )
-                            if post_response is not None and "error_code" not in post_response:
-                                self.log.info(
-                                    f"Welcome message from {pool_config.pool_url}: "
-                                    f"{post_response['welcome_message']}"
-                                )
-                                # Now we should be able to update the local farmer info
-                                farmer_info, farmer_is_known = await update_pool_farmer_info()
-                                if farmer_info is None and not farmer_is_known:
-                                    self.log.error("Failed to update farmer info after POST /farmer.")
-
-                        # Update the farmer information on the pool if the payout instructions changed or if the
-                        # signature is invalid (latter to make sure the pool has the correct authentication public key).
-                        payout_instructions_update_required: bool = (
-                            farmer_info is not None
-                            and pool_config.payout_instructions.lower() != farmer_info.payout_instructions.lower()
+                    pool_state["next_pool_info_update"] = now + UPDATE_POOL_INFO_FAILURE_RETRY_INTERVAL
+
+                if pool_info_result is not None and pool_info_result.new_pool_url is not None:
+                    update_pool_url(self._root_path, pool_config, pool_info_result.new_pool_url)
+
+            if now >= pool_state["next_farmer_update"]:
+                pool_state["next_farmer_update"] = now + UPDATE_POOL_FARMER_INFO_INTERVAL
+                authentication_token_timeout = pool_state["authentication_token_timeout"]
+
+                async def update_pool_farmer_info() -> Tuple[Optional[GetFarmerResponse], Optional[PoolErrorCode]]:
+                    # Run a GET /farmer to see if the farmer is already known by the pool
+                    response = await self._pool_get_farmer(pool_config, authentication_token_timeout, authentication_sk)
+                    farmer_response: Optional[GetFarmerResponse] = None
+                    error_code_response: Optional[PoolErrorCode] = None
+                    if response is not None:
+                        if "error_code" not in response:
+                            farmer_response = GetFarmerResponse.from_json_dict(response)
+                            if farmer_response is not None:
+                                pool_state["current_difficulty"] = farmer_response.current_difficulty
+                                pool_state["current_points"] = farmer_response.current_points
+                        else:
+                            try:
+                                error_code_response = PoolErrorCode(response["error_code"])
+                            except ValueError:
+                                self.log.error(f"Invalid error code received from the pool: {response['error_code']}")
+
+                    return farmer_response, error_code_response
+
+                if authentication_token_timeout is not None:
+                    farmer_info, error_code = await update_pool_farmer_info()
+                    if error_code == PoolErrorCode.FARMER_NOT_KNOWN:
+                        # Make the farmer known on the pool with a POST /farmer
+                        owner_sk_and_index = find_owner_sk(self.all_root_sks, pool_config.owner_public_key)
+                        assert owner_sk_and_index is not None
+                        post_response = await self._pool_post_farmer(
+                            pool_config, authentication_token_timeout, owner_sk_and_index[0]
                         )
-                        if payout_instructions_update_required or error_code == PoolErrorCode.INVALID_SIGNATURE:
-                            owner_sk_and_index = find_owner_sk(self.all_root_sks, pool_config.owner_public_key)
-                            assert owner_sk_and_index is not None
-                            await self._pool_put_farmer(
-                                pool_config, authentication_token_timeout, owner_sk_and_index[0]
+                        if post_response is not None and "error_code" not in post_response:
+                            self.log.info(
+                                f"Welcome message from {pool_config.pool_url}: " f"{post_response['welcome_message']}"
                             )
-                    else:
-                        self.log.warning(
-                            f"No pool specific authentication_token_timeout has been set for {p2_singleton_puzzle_hash}"
-                            f", check communication with the pool."
-                        )
+                            # Now we should be able to update the local farmer info
+                            farmer_info, farmer_is_known = await update_pool_farmer_info()
+                            if farmer_info is None and not farmer_is_known:
+                                self.log.error("Failed to update farmer info after POST /farmer.")
+
+                    # Update the farmer information on the pool if the payout instructions changed or if the
+                    # signature is invalid (latter to make sure the pool has the correct authentication public key).
+                    payout_instructions_update_required: bool = (
+                        farmer_info is not None
+                        and pool_config.payout_instructions.lower() != farmer_info.payout_instructions.lower()
+                    )
+                    if payout_instructions_update_required or error_code == PoolErrorCode.INVALID_SIGNATURE:
+                        owner_sk_and_index = find_owner_sk(self.all_root_sks, pool_config.owner_public_key)
+                        assert owner_sk_and_index is not None
+                        await self._pool_put_farmer(pool_config, authentication_token_timeout, owner_sk_and_index[0])
+                else:
+                    self.log.warning(
+                        f"No pool specific authentication_token_timeout has been set for {p2_singleton_puzzle_hash}"
+                        f", check communication with the pool."
+                    )
 
-            except Exception as e:
-                tb = traceback.format_exc()
-                self.log.error(f"Exception in update_pool_state for {pool_config.pool_url}, {e} {tb}")
+        except Exception as e:
+            tb = traceback.format_exc()
+            self.log.error(f"Exception in update_pool_state for {pool_config.pool_url}, {e} {tb}")
 
     def get_public_keys(self) -> List[G1Element]:
         return [child_sk.get_g1() for child_sk in self._private_keys]
@@ -666,21 +692,32 @@ class Farmer:
     async def get_reward_targets(self, search_for_private_key: bool, max_ph_to_search: int = 500) -> Dict[str, Any]:
         if search_for_private_key:
             all_sks = await self.get_all_private_keys()
-            have_farmer_sk, have_pool_sk = False, False
-            search_addresses: List[bytes32] = [self.farmer_target, self.pool_target]
-            for sk, _ in all_sks:
-                found_addresses: Set[bytes32] = match_address_to_sk(sk, search_addresses, max_ph_to_search)
+            search_key = (
+                self.farmer_target,
+                self.pool_target,
+                max_ph_to_search,
+                tuple(bytes(sk) for sk, _ in all_sks),
+            )
+            if self._reward_targets_search is not None and self._reward_targets_search[0] == search_key:
+                have_farmer_sk, have_pool_sk = self._reward_targets_search[1]
+            else:
+                have_farmer_sk, have_pool_sk = False, False
+                search_addresses: List[bytes32] = [self.farmer_target, self.pool_target]
+                for sk, _ in all_sks:
+                    found_addresses: Set[bytes32] = match_address_to_sk(sk, search_addresses, max_ph_to_search)
+
+                    if not have_farmer_sk and self.farmer_target in found_addresses:
+                        search_addresses.remove(self.farmer_target)
+                        have_farmer_sk = True
 
-                if not have_farmer_sk and self.farmer_target in found_addresses:
-                    search_addresses.remove(self.farmer_target)
-                    have_farmer_sk = True
+                    if not have_pool_sk and self.pool_target in found_addresses:
+                        search_addresses.remove(self.pool_target)
+                        have_pool_sk = True
 
-                if not have_pool_sk and self.pool_target in found_addresses:
-                    search_addresses.remove(self.pool_target)
-                    have_pool_sk = True
+                    if have_farmer_sk and have_pool_sk:
+                        break
 
-                if have_farmer_sk and have_pool_sk:
-                    break
+                self._reward_targets_search = (search_key, (have_farmer_sk, have_pool_sk))
 
             return {
                 "farmer_target": self.farmer_target_encoded,
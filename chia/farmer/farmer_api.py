@@ -5,7 +5,6 @@ import logging
 import time
 from typing import Any, Dict, List, Optional, Union
 
-import aiohttp
 from chia_rs import AugSchemeMPL, G2Element, PrivateKey
 
 from chia import __version__
@@ -31,9 +30,7 @@ from chia.protocols.pool_protocol import (
 )
 from chia.protocols.protocol_message_types import ProtocolMessageTypes
 from chia.server.outbound_message import Message, NodeType, make_msg
-from chia.server.server import ssl_context_for_root
 from chia.server.ws_connection import WSChiaConnection
-from chia.ssl.create_ssl import get_mozilla_ca_crt
 from chia.types.blockchain_format.pool_target import PoolTarget
 from chia.types.blockchain_format.proof_of_space import (
     calculate_prefix_bits,
@@ -356,84 +353,82 @@ class FarmerAPI:
                 )
                 self.farmer.log.debug(f"POST /partial request {post_partial_request}")
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.post(
-                            f"{pool_url}/partial",
-                            json=post_partial_request.to_json_dict(),
-                            ssl=ssl_context_for_root(get_mozilla_ca_crt(), log=self.farmer.log),
-                            headers={"User-Agent": f"Chia Blockchain v.{__version__}"},
-                        ) as resp:
-                            if not resp.ok:
-                                self.farmer.log.error(f"Error sending partial to {pool_url}, {resp.status}")
+                    async with self.farmer.http_session.post(
+                        f"{pool_url}/partial",
+                        json=post_partial_request.to_json_dict(),
+                        ssl=self.farmer.pool_ssl_context,
+                        headers={"User-Agent": f"Chia Blockchain v.{__version__}"},
+                    ) as resp:
+                        if not resp.ok:
+                            self.farmer.log.error(f"Error sending partial to {pool_url}, {resp.status}")
+                            increment_pool_stats(
+                                self.farmer.pool_state,
+                                p2_singleton_puzzle_hash,
+                                "invalid_partials",
+                                time.time(),
+                            )
+                            return
+
+                        pool_response: Dict[str, Any] = json.loads(await resp.text())
+                        self.farmer.log.info(f"Pool response: {pool_response}")
+                        if "error_code" in pool_response:
+                            self.farmer.log.error(
+                                f"Error in pooling: " f"{pool_response['error_code'], pool_response['error_message']}"
+                            )
+
+                            increment_pool_stats(
+                                self.farmer.pool_state,
+                                p2_singleton_puzzle_hash,
+                                "pool_errors",
+                                time.time(),
+                                value=pool_response,
+                            )
+
+                            if pool_response["error_code"] == PoolErrorCode.TOO_LATE.value:
                                 increment_pool_stats(
                                     self.farmer.pool_state,
                                     p2_singleton_puzzle_hash,
-                                    "invalid_partials",
+                                    "stale_partials",
                                     time.time(),
                                 )
-                                return
-
-                            pool_response: Dict[str, Any] = json.loads(await resp.text())
-                            self.farmer.log.info(f"Pool response: {pool_response}")
-                            if "error_code" in pool_response:
+                            elif pool_response["error_code"] == PoolErrorCode.PROOF_NOT_GOOD_ENOUGH.value:
                                 self.farmer.log.error(
-                                    f"Error in pooling: "
-                                    f"{pool_response['error_code'], pool_response['error_message']}"
+                                    "Partial not good enough, forcing pool farmer update to "
+                                    "get our current difficulty."
                                 )
-
                                 increment_pool_stats(
                                     self.farmer.pool_state,
                                     p2_singleton_puzzle_hash,
-                                    "pool_errors",
+                                    "insufficient_partials",
                                     time.time(),
-                                    value=pool_response,
                                 )
+                                pool_state_dict["next_farmer_update"] = 0
+                                await self.farmer.update_pool_state()
+                            else:
+                                increment_pool_stats(
+                                    self.farmer.pool_state,
+                                    p2_singleton_puzzle_hash,
+                                    "invalid_partials",
+                                    time.time(),
+                                )
+                            return
 
-                                if pool_response["error_code"] == PoolErrorCode.TOO_LATE.value:
-                                    increment_pool_stats(
-                                        self.farmer.pool_state,
-                                        p2_singleton_puzzle_hash,
-                                        "stale_partials",
-                                        time.time(),
-                                    )
-                                elif pool_response["error_code"] == PoolErrorCode.PROOF_NOT_GOOD_ENOUGH.value:
-                                    self.farmer.log.error(
-                                        "Partial not good enough, forcing pool farmer update to "
-                                        "get our current difficulty."
-                                    )
-                                    increment_pool_stats(
-                                        self.farmer.pool_state,
-                                        p2_singleton_puzzle_hash,
-                                        "insufficient_partials",
-                                        time.time(),
-                                    )
-                                    pool_state_dict["next_farmer_update"] = 0
-                                    await self.farmer.update_pool_state()
-                                else:
-                                    increment_pool_stats(
-                                        self.farmer.pool_state,
-                                        p2_singleton_puzzle_hash,
-                                        "invalid_partials",
-                                        time.time(),
-                                    )
-                                return
-
-                            increment_pool_stats(
-                                self.farmer.pool_state,
-                                p2_singleton_puzzle_hash,
-                                "valid_partials",
-                                time.time(),
-                            )
-                            new_difficulty = pool_response["new_difficulty"]
-                            increment_pool_stats(
-                                self.farmer.pool_state,
-                                p2_singleton_puzzle_hash,
-                                "points_acknowledged",
-                                time.time(),
-                                new_difficulty,
-                                new_difficulty,
-                            )
-                            pool_state_dict["current_difficulty"] = new_difficulty
+                        increment_pool_stats(
+                            self.farmer.pool_state,
+                            p2_singleton_puzzle_hash,
+                            "valid_partials",
+                            time.time(),
+                        )
+                        new_difficulty = pool_response["new_difficulty"]
+                        increment_pool_stats(
+                            self.farmer.pool_state,
+                            p2_singleton_puzzle_hash,
+                            "points_acknowledged",
+                            time.time(),
+                            new_difficulty,
+                            new_difficulty,
+                        )
+                        pool_state_dict["current_difficulty"] = new_difficulty
                 except Exception as e:
                     self.farmer.log.error(f"Error connecting to pool: {e}")
 
@@ -464,7 +459,7 @@ class FarmerAPI:
                         "pool_url": pool_url,
                         "current_difficulty": pool_state_dict["current_difficulty"],
                         "points_acknowledged_since_start": pool_state_dict["points_acknowledged_since_start"],
-                        "points_acknowledged_24h": pool_state_dict["points_acknowledged_24h"],
+                        "points_acknowledged_24h": list(pool_state_dict["points_acknowledged_24h"]),
                     },
                 )
 
@@ -547,7 +542,7 @@ class FarmerAPI:
                     if key not in pool_dict:
                         continue
 
-                    pool_dict[key] = strip_old_entries(pairs=pool_dict[key], before=cutoff_24h)
+                    strip_old_entries(pairs=pool_dict[key], before=cutoff_24h)
 
         now = uint64(int(time.time()))
         self.farmer.cache_add_time[new_signage_point.challenge_chain_sp] = now
@@ -39,7 +39,10 @@ class PoolWalletConfig(Streamable):
 
 
 def load_pool_config(root_path: Path) -> List[PoolWalletConfig]:
-    config = load_config(root_path, "config.yaml")
+    return get_pool_config_list(load_config(root_path, "config.yaml"))
+
+
+def get_pool_config_list(config: Dict[str, Any]) -> List[PoolWalletConfig]:
     ret_list: List[PoolWalletConfig] = []
     pool_list = config["pool"].get("pool_list", [])
     if pool_list is None:
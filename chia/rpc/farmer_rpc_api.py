@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import operator
+from collections import deque
 from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
 from typing_extensions import Protocol
@@ -300,7 +301,8 @@ class FarmerRpcApi:
     async def get_pool_state(self, request: Dict[str, Any]) -> EndpointResult:
         pools_list = []
         for p2_singleton_puzzle_hash, pool_dict in self.service.pool_state.items():
-            pool_state = pool_dict.copy()
+            # The 24h stats are kept in deques, which aren't JSON serializable
+            pool_state = {key: list(value) if isinstance(value, deque) else value for key, value in pool_dict.items()}
             pool_state["plot_count"] = self.get_pool_contract_puzzle_hash_plot_count(p2_singleton_puzzle_hash)
             pools_list.append(pool_state)
         return {"pool_state": pools_list}
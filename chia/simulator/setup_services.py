@@ -261,6 +261,8 @@ async def setup_wallet_node(
             db_path.unlink()
         service_config["database_path"] = str(db_name)
         service_config["testing"] = True
+        # The test wallet DB is thrown away afterwards, skip syncing it to disk on every commit
+        service_config["db_sync"] = "off"
 
         service_config["introducer_peer"]["host"] = self_hostname
         if introducer_port is not None:
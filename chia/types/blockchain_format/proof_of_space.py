@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, cast
+from functools import lru_cache
+from typing import Optional
 
 import chia_rs
-from bitstring import BitArray
 from chia_rs import AugSchemeMPL, G1Element, PrivateKey
 from chiapos import Verifier
 
@@ -17,6 +17,9 @@ ProofOfSpace = chia_rs.ProofOfSpace
 
 log = logging.getLogger(__name__)
 
+# stateless, so a single instance can be shared for all validations
+_verifier = Verifier()
+
 
 def get_plot_id(pos: ProofOfSpace) -> bytes32:
     assert pos.pool_public_key is None or pos.pool_contract_puzzle_hash is None
@@ -62,7 +65,13 @@ def verify_and_get_quality_string(
 
 
 def get_quality_string(pos: ProofOfSpace, plot_id: bytes32) -> Optional[bytes32]:
-    quality_str = Verifier().validate_proof(plot_id, pos.size, pos.challenge, bytes(pos.proof))
+    return validate_proof(plot_id, pos.size, pos.challenge, bytes(pos.proof))
+
+
+# the same proof is usually validated more than once, e.g. for the unfinished and the finished block
+@lru_cache(maxsize=1000)
+def validate_proof(plot_id: bytes32, size: int, challenge: bytes32, proof: bytes) -> Optional[bytes32]:
+    quality_str = _verifier.validate_proof(plot_id, size, challenge, proof)
     if not quality_str:
         return None
     return bytes32(quality_str)
@@ -80,9 +89,9 @@ def passes_plot_filter(
     if prefix_bits == 0:
         return True
 
-    plot_filter = BitArray(calculate_plot_filter_input(plot_id, challenge_hash, signage_point))
-    # TODO: compensating for https://github.com/scott-griffiths/bitstring/issues/248
-    return cast(bool, plot_filter[:prefix_bits].uint == 0)
+    # the plot passes if the first `prefix_bits` bits of the filter input are all zero
+    plot_filter = int.from_bytes(calculate_plot_filter_input(plot_id, challenge_hash, signage_point), "big")
+    return plot_filter >> (256 - prefix_bits) == 0
 
 
 def calculate_prefix_bits(constants: ConsensusConstants, height: uint32) -> int:
@@ -11,7 +11,7 @@ import tempfile
 import time
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Type, Union, cast
 
 import importlib_resources
 import yaml
@@ -23,6 +23,11 @@ from chia.util.lock import Lockfile
 
 log = logging.getLogger(__name__)
 
+# Prefer the libyaml backed loader, it parses config.yaml many times faster than the pure Python one
+_yaml_loader: Union[Type[yaml.SafeLoader], Type[yaml.CSafeLoader]] = (
+    yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+)
+
 
 def initial_config_file(filename: Union[str, Path]) -> str:
     initial_config_path = importlib_resources.files(__name__.rpartition(".")[0]).joinpath(f"initial-{filename}")
@@ -135,9 +140,9 @@ def _load_config_maybe_locked(
                 if acquire_lock:
                     exit_stack.enter_context(lock_config(root_path, filename))
                 with open(path) as opened_config_file:
-                    r = yaml.safe_load(opened_config_file)
+                    r = yaml.load(opened_config_file, Loader=_yaml_loader)
             if r is None:
-                log.error(f"yaml.safe_load returned None: {path}")
+                log.error(f"yaml.load returned None: {path}")
                 time.sleep(i * 0.1)
                 continue
             if fill_missing_services:
@@ -312,7 +317,7 @@ def load_defaults_for_missing_services(config: Dict[str, Any], config_name: str)
     if len(missing_services) > 0:
         marshalled_default_config: str = initial_config_file(config_name)
 
-        unmarshalled_default_config = yaml.safe_load(marshalled_default_config)
+        unmarshalled_default_config = yaml.load(marshalled_default_config, Loader=_yaml_loader)
 
         for service in missing_services:
             defaulted[service] = unmarshalled_default_config[service]
@@ -4,7 +4,7 @@ import logging
 from typing import Dict, Optional
 
 from chia.types.blockchain_format.sized_bytes import bytes32
-from chia.util.db_wrapper import DBWrapper2
+from chia.util.db_wrapper import DBWrapper2, execute_fetchone
 from chia.wallet.lineage_proof import LineageProof
 
 log = logging.getLogger(__name__)
@@ -47,12 +47,11 @@ class CATLineageStore:
 
     async def get_lineage_proof(self, coin_id: bytes32) -> Optional[LineageProof]:
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute(
+            row = await execute_fetchone(
+                conn,
                 f"SELECT * FROM {self.table_name} WHERE coin_id=?;",
                 (coin_id.hex(),),
             )
-            row = await cursor.fetchone()
-            await cursor.close()
 
         if row is not None and row[0] is not None:
             ret: LineageProof = LineageProof.from_bytes(row[1])
@@ -62,9 +61,7 @@ class CATLineageStore:
 
     async def get_all_lineage_proofs(self) -> Dict[bytes32, LineageProof]:
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute(f"SELECT * FROM {self.table_name}")
-            rows = await cursor.fetchall()
-            await cursor.close()
+            rows = await conn.execute_fetchall(f"SELECT * FROM {self.table_name}")
 
         lineage_dict = {}
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+from functools import lru_cache
 from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from chia_rs import G1Element
@@ -37,6 +39,8 @@ INTERMEDIATE_LAUNCHER_MOD = load_clvm_maybe_recompile(
     "nft_intermediate_launcher.clsp", package_or_requirement="chia.wallet.nft_wallet.puzzles"
 )
 
+log = logging.getLogger(__name__)
+
 
 def create_innerpuz(
     p2_puzzle_or_hash: Union[Program, bytes32],
@@ -58,7 +62,7 @@ def create_innerpuz(
     Note: Receiving a standard P2 puzzle hash wouldn't calculate a valid puzzle, but
     that can be useful if calling `.get_tree_hash_precalc()` on it.
     """
-    backup_ids_hash: Union[Program, bytes32] = Program.to(recovery_list).get_tree_hash()
+    backup_ids_hash: Union[Program, bytes32] = shatree_atom_list(recovery_list)
     if recovery_list_hash is not None:
         backup_ids_hash = recovery_list_hash
     singleton_struct = Program.to((SINGLETON_TOP_LAYER_MOD_HASH, (launcher_id, SINGLETON_LAUNCHER_PUZZLE_HASH)))
@@ -84,24 +88,43 @@ def get_inner_puzhash_by_p2(
     :return: DID inner puzzle hash
     """
 
-    backup_ids_hash = shatree_atom_list(recovery_list)
-
-    # singleton_struct = (MOD_HASH . (LAUNCHER_ID . LAUNCHER_PUZZLE_HASH))
-    singleton_struct = shatree_pair(
-        SINGLETON_TOP_LAYER_MOD_HASH_TREE_HASH,
-        shatree_pair(shatree_atom(launcher_id), SINGLETON_LAUNCHER_PUZZLE_HASH_TREE_HASH),
+    backup_ids_hash, num_of_backup_ids_needed_hash, singleton_struct = get_did_curried_args_hashes(
+        tuple(recovery_list), num_of_backup_ids_needed, launcher_id
     )
 
     return curry_and_treehash(
         DID_INNERPUZ_MOD_HASH_QUOTED,
         p2_puzhash,
-        shatree_atom(backup_ids_hash),
-        shatree_int(num_of_backup_ids_needed),
+        backup_ids_hash,
+        num_of_backup_ids_needed_hash,
         singleton_struct,
         metadata.get_tree_hash(),
     )
 
 
+# these only change per DID, while the p2 puzzle hash changes for every derivation
+@lru_cache(maxsize=1000)
+def get_did_curried_args_hashes(
+    recovery_list: Tuple[bytes32, ...], num_of_backup_ids_needed: uint64, launcher_id: bytes32
+) -> Tuple[bytes32, bytes32, bytes32]:
+    """
+    Calculate the tree hashes of the DID inner puzzle arguments which don't depend on the P2 puzzle
+    :param recovery_list: A list of DIDs used for the recovery
+    :param num_of_backup_ids_needed: Need how many DIDs for the recovery
+    :param launcher_id: ID of the launch coin
+    :return: Tree hashes of the recovery list hash, the number of backup ids needed and the singleton struct
+    """
+    backup_ids_hash = shatree_atom_list(recovery_list)
+
+    # singleton_struct = (MOD_HASH . (LAUNCHER_ID . LAUNCHER_PUZZLE_HASH))
+    singleton_struct = shatree_pair(
+        SINGLETON_TOP_LAYER_MOD_HASH_TREE_HASH,
+        shatree_pair(shatree_atom(launcher_id), SINGLETON_LAUNCHER_PUZZLE_HASH_TREE_HASH),
+    )
+
+    return shatree_atom(backup_ids_hash), shatree_int(num_of_backup_ids_needed), singleton_struct
+
+
 def is_did_innerpuz(inner_f: Program) -> bool:
     """
     Check if a puzzle is a DID inner mode
@@ -176,10 +199,8 @@ def match_did_puzzle(mod: Program, curried_args: Program) -> Optional[Iterator[P
             mod, curried_args = curried_args.rest().first().uncurry()
             if mod == DID_INNERPUZ_MOD:
                 return curried_args.as_iter()
-    except Exception:
-        import traceback
-
-        print(f"exception: {traceback.format_exc()}")
+    except Exception as e:
+        log.debug(f"Failed to match DID puzzle: {e}")
     return None
 
 
@@ -202,10 +223,7 @@ def metadata_to_program(metadata: Dict[str, str]) -> Program:
     :param metadata: User defined metadata
     :return: Chialisp program
     """
-    kv_list = []
-    for key, value in metadata.items():
-        kv_list.append((key, value))
-    return Program.to(kv_list)
+    return Program.to(list(metadata.items()))
 
 
 def did_program_to_metadata(program: Program) -> Dict[str, str]:
@@ -214,7 +232,4 @@ def did_program_to_metadata(program: Program) -> Dict[str, str]:
     :param program: Chialisp program contains the metadata
     :return: Metadata dict
     """
-    metadata = {}
-    for key, val in program.as_python():
-        metadata[str(key, "utf-8")] = str(val, "utf-8")
-    return metadata
+    return {key.decode("utf-8"): val.decode("utf-8") for key, val in program.as_python()}
@@ -8,7 +8,7 @@ import aiosqlite
 
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.types.mempool_inclusion_status import MempoolInclusionStatus
-from chia.util.db_wrapper import DBWrapper2
+from chia.util.db_wrapper import DBWrapper2, execute_fetchone
 from chia.util.errors import Err
 from chia.util.ints import uint8, uint32
 from chia.wallet.conditions import ConditionValidTimes
@@ -304,9 +304,7 @@ class TradeStore:
         query += "FROM trade_records"
 
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute(query)
-            row = await cursor.fetchone()
-            await cursor.close()
+            row = await execute_fetchone(conn, query)
 
         total = 0
         my_offers_count = 0
@@ -327,9 +325,9 @@ class TradeStore:
         Checks DB for TradeRecord with id: id and returns it.
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT trade_record from trade_records WHERE trade_id=?", (trade_id.hex(),))
-            row = await cursor.fetchone()
-            await cursor.close()
+            row = await execute_fetchone(
+                conn, "SELECT trade_record from trade_records WHERE trade_id=?", (trade_id.hex(),)
+            )
         if row is not None:
             return (await self._get_new_trade_records_from_old([TradeRecordOld.from_bytes(row[0])]))[0]
         return None
@@ -339,9 +337,7 @@ class TradeStore:
         Checks DB for TradeRecord with id: id and returns it.
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT trade_record from trade_records WHERE status=?", (status.value,))
-            rows = await cursor.fetchall()
-            await cursor.close()
+            rows = await conn.execute_fetchall("SELECT trade_record from trade_records WHERE status=?", (status.value,))
 
         return await self._get_new_trade_records_from_old([TradeRecordOld.from_bytes(row[0]) for row in rows])
 
@@ -366,9 +362,7 @@ class TradeStore:
         """
 
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT trade_record from trade_records")
-            rows = await cursor.fetchall()
-            await cursor.close()
+            rows = await conn.execute_fetchall("SELECT trade_record from trade_records")
 
         return await self._get_new_trade_records_from_old([TradeRecordOld.from_bytes(row[0]) for row in rows])
 
@@ -469,9 +463,7 @@ class TradeStore:
         args.extend([limit, offset])
 
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute(query, tuple(args))
-            rows = await cursor.fetchall()
-            await cursor.close()
+            rows = await conn.execute_fetchall(query, tuple(args))
 
         return await self._get_new_trade_records_from_old([TradeRecordOld.from_bytes(row[0]) for row in rows])
 
@@ -9,7 +9,7 @@ from aiosqlite import Row
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import Program
 from chia.types.blockchain_format.sized_bytes import bytes32
-from chia.util.db_wrapper import DBWrapper2
+from chia.util.db_wrapper import DBWrapper2, execute_fetchone
 from chia.util.ints import uint32, uint64
 from chia.util.streamable import Streamable, streamable
 from chia.wallet.lineage_proof import LineageProof
@@ -184,9 +184,7 @@ class VCStore:
         Checks DB for VC with specified launcher_id and returns it.
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT * from vc_records WHERE launcher_id=?", (launcher_id.hex(),))
-            row = await cursor.fetchone()
-            await cursor.close()
+            row = await execute_fetchone(conn, "SELECT * from vc_records WHERE launcher_id=?", (launcher_id.hex(),))
         if row is not None:
             return _row_to_vc_record(row)
         return None
@@ -197,12 +195,10 @@ class VCStore:
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
             providers_param: str = ", ".join(["?"] * len(provider_ids))
-            cursor = await conn.execute(
+            rows = await conn.execute_fetchall(
                 f"SELECT * from vc_records WHERE proof_provider IN ({providers_param}) LIMIT 1000",
                 tuple(id.hex() for id in provider_ids),
             )
-            rows = await cursor.fetchall()
-            await cursor.close()
 
         return [_row_to_vc_record(row) for row in rows]
 
@@ -211,9 +207,7 @@ class VCStore:
         Returns all VCs that have not yet been marked confirmed (confirmed_height == 0)
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT * from vc_records WHERE confirmed_height=0 LIMIT 1000")
-            rows = await cursor.fetchall()
-            await cursor.close()
+            rows = await conn.execute_fetchall("SELECT * from vc_records WHERE confirmed_height=0 LIMIT 1000")
         records = [_row_to_vc_record(row) for row in rows]
 
         return records
@@ -239,9 +233,7 @@ class VCStore:
 
     async def get_vc_record_by_coin_id(self, coin_id: bytes32) -> Optional[VCRecord]:
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT * from vc_records WHERE coin_id=? LIMIT 1000", (coin_id.hex(),))
-            row = await cursor.fetchone()
-            await cursor.close()
+            row = await execute_fetchone(conn, "SELECT * from vc_records WHERE coin_id=? LIMIT 1000", (coin_id.hex(),))
         if row is not None:
             return _row_to_vc_record(row)
         return None
@@ -254,9 +246,7 @@ class VCStore:
 
     async def get_proofs_for_root(self, root: bytes32) -> Optional[VCProofs]:
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT proofs FROM vc_proofs WHERE root=?", (root.hex(),))
-            row = await cursor.fetchone()
-            await cursor.close()
+            row = await execute_fetchone(conn, "SELECT proofs FROM vc_proofs WHERE root=?", (root.hex(),))
             if row is None:
                 return None  # pragma: no cover
             else:
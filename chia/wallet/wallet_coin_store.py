@@ -302,6 +302,15 @@ class WalletCoinStore:
             )
         return {self.coin_record_from_row(row) for row in rows}
 
+    async def get_unspent_amount_for_wallet(self, wallet_id: int, coin_type: CoinType = CoinType.NORMAL) -> int:
+        """Returns the total amount of the coins that have not been spent yet for a wallet."""
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            rows = await conn.execute_fetchall(
+                "SELECT amount FROM coin_record WHERE coin_type=? AND wallet_id=? AND spent_height=0",
+                (coin_type, wallet_id),
+            )
+        return sum(uint64.from_bytes(row[0]) for row in rows)
+
     async def get_all_unspent_coins(self, coin_type: CoinType = CoinType.NORMAL) -> Set[WalletCoinRecord]:
         """Returns set of CoinRecords that have not been spent yet for a wallet."""
         async with self.db_wrapper.reader_no_transaction() as conn:
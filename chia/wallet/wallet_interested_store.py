@@ -4,7 +4,7 @@ from typing import List, Optional, Tuple
 
 from chia.protocols.wallet_protocol import CoinState
 from chia.types.blockchain_format.sized_bytes import bytes32
-from chia.util.db_wrapper import DBWrapper2
+from chia.util.db_wrapper import DBWrapper2, execute_fetchone
 from chia.util.ints import uint32
 
 
@@ -40,8 +40,7 @@ class WalletInterestedStore:
 
     async def get_interested_coin_ids(self) -> List[bytes32]:
         async with self.db_wrapper.writer_maybe_transaction() as conn:
-            cursor = await conn.execute("SELECT coin_name FROM interested_coins")
-            rows_hex = await cursor.fetchall()
+            rows_hex = await conn.execute_fetchall("SELECT coin_name FROM interested_coins")
         return [bytes32(bytes.fromhex(row[0])) for row in rows_hex]
 
     async def add_interested_coin_id(self, coin_id: bytes32) -> None:
@@ -56,16 +55,14 @@ class WalletInterestedStore:
 
     async def get_interested_puzzle_hashes(self) -> List[Tuple[bytes32, int]]:
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute("SELECT puzzle_hash, wallet_id FROM interested_puzzle_hashes")
-            rows_hex = await cursor.fetchall()
+            rows_hex = await conn.execute_fetchall("SELECT puzzle_hash, wallet_id FROM interested_puzzle_hashes")
         return [(bytes32(bytes.fromhex(row[0])), row[1]) for row in rows_hex]
 
     async def get_interested_puzzle_hash_wallet_id(self, puzzle_hash: bytes32) -> Optional[int]:
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute(
-                "SELECT wallet_id FROM interested_puzzle_hashes WHERE puzzle_hash=?", (puzzle_hash.hex(),)
+            row = await execute_fetchone(
+                conn, "SELECT wallet_id FROM interested_puzzle_hashes WHERE puzzle_hash=?", (puzzle_hash.hex(),)
             )
-            row = await cursor.fetchone()
         if row is None:
             return None
         return row[0]
@@ -117,10 +114,9 @@ class WalletInterestedStore:
         :return: A json style list of unacknowledged CATs
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
-            cursor = await conn.execute(
+            cats = await conn.execute_fetchall(
                 "SELECT asset_id, name, first_seen_height, sender_puzzle_hash FROM unacknowledged_asset_tokens"
             )
-            cats = await cursor.fetchall()
         return [
             {"asset_id": cat[0], "name": cat[1], "first_seen_height": cat[2], "sender_puzzle_hash": cat[3]}
             for cat in cats
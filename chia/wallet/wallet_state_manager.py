@@ -713,7 +713,7 @@ class WalletStateManager:
                 coin_type = CoinType.CRCAT
             else:
                 coin_type = CoinType.NORMAL
-            unspent_coin_records = await self.coin_store.get_unspent_coins_for_wallet(wallet_id, coin_type)
+            return uint128(await self.coin_store.get_unspent_amount_for_wallet(wallet_id, coin_type))
         return uint128(sum(cr.coin.amount for cr in unspent_coin_records))
 
     async def get_unconfirmed_balance(
@@ -2285,12 +2285,11 @@ class WalletStateManager:
                 additional_signing_responses != [],
             )
         all_coins_names = []
-        async with self.db_wrapper.writer_maybe_transaction():
-            for tx_record in tx_records:
-                # Wallet node will use this queue to retry sending this transaction until full nodes receives it
-                await self.tx_store.add_transaction_record(tx_record)
-                all_coins_names.extend([coin.name() for coin in tx_record.additions])
-                all_coins_names.extend([coin.name() for coin in tx_record.removals])
+        # Wallet node will use this queue to retry sending these transactions until full nodes receives them
+        await self.tx_store.add_transaction_records(tx_records)
+        for tx_record in tx_records:
+            all_coins_names.extend([coin.name() for coin in tx_record.additions])
+            all_coins_names.extend([coin.name() for coin in tx_record.removals])
 
         await self.add_interested_coin_ids(all_coins_names)
 
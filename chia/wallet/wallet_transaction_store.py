@@ -99,7 +99,15 @@ class WalletTransactionStore:
         """
         Store TransactionRecord in DB and Cache.
         """
-        async with self.db_wrapper.writer_maybe_transaction() as conn:
+        await self.add_transaction_records([record])
+
+    async def add_transaction_records(self, records: List[TransactionRecord]) -> None:
+        """
+        Store multiple TransactionRecords in DB with one insert per table.
+        """
+        sql_records = []
+        sql_valid_times = []
+        for record in records:
             transaction_record_old = TransactionRecordOld(
                 confirmed_at_height=record.confirmed_at_height,
                 created_at_time=record.created_at_time,
@@ -118,8 +126,7 @@ class WalletTransactionStore:
                 name=record.name,
                 memos=record.memos,
             )
-            await conn.execute_insert(
-                "INSERT OR REPLACE INTO transaction_record VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            sql_records.append(
                 (
                     bytes(transaction_record_old),
                     record.name,
@@ -133,11 +140,18 @@ class WalletTransactionStore:
                     record.wallet_id,
                     record.trade_id,
                     record.type,
-                ),
-            )
-            await conn.execute_insert(
-                "INSERT OR REPLACE INTO tx_times VALUES (?, ?)", (record.name, bytes(record.valid_times))
+                )
             )
+            sql_valid_times.append((record.name, bytes(record.valid_times)))
+
+        async with self.db_wrapper.writer_maybe_transaction() as conn:
+            await (
+                await conn.executemany(
+                    "INSERT OR REPLACE INTO transaction_record VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    sql_records,
+                )
+            ).close()
+            await (await conn.executemany("INSERT OR REPLACE INTO tx_times VALUES (?, ?)", sql_valid_times)).close()
 
     async def delete_transaction_record(self, tx_id: bytes32) -> None:
         async with self.db_wrapper.writer_maybe_transaction() as conn: